@@ -20,6 +20,7 @@ import os
 import re
 import subprocess
 import sys
+from collections.abc import Callable
 from pathlib import Path
 
 import shutil
@@ -370,6 +371,11 @@ _HIGHLIGHT_LINE = "#FFFFCC"
 _STATUS_BG = "#D4D0C8"
 _TREE_BG = "#FFFFFF"
 
+# Output-window separator lines
+_SEP_THIN = "─" * 60
+_SEP_THICK = "═" * 60
+_SEP_EQ = "=" * 60
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Syntax Highlighter
@@ -1144,7 +1150,11 @@ class MplabIDE(QMainWindow):
 
         self._file_paths: dict[int, str] = {}  # tab index → file path
         self._modified: dict[int, bool] = {}
+        self._dirty_indices: set[int] = set()   # tab indices with unsaved changes
+        self._tab_basename: dict[int, str] = {}  # tab index → title without " *"
         self._python = self._find_python()
+        self._ref_cache: str | None = None  # instruction reference text (static)
+        self._out_buf: list[str] = []  # pending output lines, see _flush_output
 
         # ── Assembler settings (persisted via QSettings) ──
         self._settings = QSettings("PIC-RASM", "IDE")
@@ -1158,6 +1168,7 @@ class MplabIDE(QMainWindow):
                 self._asm_path = detected_path
                 self._settings.setValue("assembler/type", self._asm_type)
                 self._settings.setValue("assembler/path", self._asm_path)
+        self._update_asm_cmd_template()
 
         # ── Programmer settings (persisted via QSettings) ──
         self._prog_type = self._settings.value("programmer/type", "none")
@@ -1198,8 +1209,19 @@ class MplabIDE(QMainWindow):
         return w if isinstance(w, CodeEditor) else None
 
     def output(self, text: str) -> None:
+        if self._out_buf:
+            self._flush_output()
         self._output_text.appendPlainText(text)
 
+    def _flush_output(self) -> None:
+        """Append all buffered output lines in one repaint."""
+        if not self._out_buf:
+            return
+        self._output_text.setUpdatesEnabled(False)
+        self._output_text.appendPlainText("\n".join(self._out_buf))
+        self._out_buf.clear()
+        self._output_text.setUpdatesEnabled(True)
+
     # ── global stylesheet (MPLAB v8.92 grey theme) ──────────────────────
 
     def _apply_global_style(self):
@@ -1577,24 +1599,37 @@ class MplabIDE(QMainWindow):
         idx = self._tabs.addTab(editor, title)
         self._tabs.setCurrentIndex(idx)
         self._file_paths[idx] = filepath
-        self._modified[idx] = False
-        editor.textChanged.connect(lambda: self._mark_modified(idx))
+        self._tab_basename[idx] = title
+        self._set_modified(idx, False)
+        # Look the index up on each change: closing an earlier tab shifts it
+        editor.textChanged.connect(lambda: self._mark_modified(self._tabs.indexOf(editor)))
         editor.cursorPositionChanged.connect(self._update_status)
         editor.attach_highlighter()
         return idx
 
+    def _set_modified(self, idx: int, flag: bool):
+        """Set the modified flag for a tab and keep the dirty-index set in sync."""
+        self._modified[idx] = flag
+        w = self._tabs.widget(idx)
+        if w is not None:
+            w._is_modified = flag
+        if flag:
+            self._dirty_indices.add(idx)
+        else:
+            self._dirty_indices.discard(idx)
+
     def _mark_modified(self, idx: int):
+        if idx < 0:
+            return              # editor no longer in a tab
         if not self._modified.get(idx):
-            self._modified[idx] = True
-            title = self._tabs.tabText(idx)
-            if not title.endswith("*"):
-                self._tabs.setTabText(idx, title + " *")
+            self._set_modified(idx, True)
+            self._tabs.setTabText(idx, self._tab_basename.get(idx, "") + " *")
 
     def _close_tab(self, idx: int):
         if idx < 0:
             return
         if self._modified.get(idx):
-            name = self._tabs.tabText(idx).rstrip(" *")
+            name = self._tab_basename.get(idx, "")
             reply = QMessageBox.question(
                 self, "Save?",
                 f"Save changes to {name}?",
@@ -1617,6 +1652,7 @@ class MplabIDE(QMainWindow):
         """Re-map tab indices after a tab close."""
         paths = {}
         mods = {}
+        names = {}
         for i in range(self._tabs.count()):
             w = self._tabs.widget(i)
             # Find old path by widget identity
@@ -1630,8 +1666,11 @@ class MplabIDE(QMainWindow):
             fp = getattr(w, "_filepath", "")
             paths[i] = fp
             mods[i] = getattr(w, "_is_modified", False)
+            names[i] = self._tabs.tabText(i).rstrip(" *")
         self._file_paths = paths
         self._modified = mods
+        self._dirty_indices = {i for i, m in mods.items() if m}
+        self._tab_basename = names
 
     def _on_tab_changed(self, idx):
         if idx >= 0:
@@ -1676,7 +1715,7 @@ class MplabIDE(QMainWindow):
         editor.setPlainText(content)
         name = Path(filepath).name
         idx = self._add_tab(editor, name, filepath)
-        self._modified[idx] = False
+        self._set_modified(idx, False)
         # Reset tab title (remove the * that textChanged may have added)
         self._tabs.setTabText(idx, name)
         self.output(f"Opened: {filepath}")
@@ -1705,10 +1744,10 @@ class MplabIDE(QMainWindow):
             QMessageBox.warning(self, "Error", f"Cannot save file:\n{e}")
             return
         editor._filepath = fp
-        editor._is_modified = False
         self._file_paths[idx] = fp
-        self._modified[idx] = False
+        self._set_modified(idx, False)
         name = Path(fp).name
+        self._tab_basename[idx] = name
         self._tabs.setTabText(idx, name)
         self.output(f"Saved: {fp}")
 
@@ -1729,9 +1768,8 @@ class MplabIDE(QMainWindow):
         self._save_file_at(idx)
 
     def _save_all(self):
-        for i in range(self._tabs.count()):
-            if self._modified.get(i):
-                self._save_file_at(i)
+        for i in sorted(self._dirty_indices):
+            self._save_file_at(i)
 
     # ── edit helpers ─────────────────────────────────────────────────────
 
@@ -1781,13 +1819,14 @@ class MplabIDE(QMainWindow):
             self.output(f"Build expects a .rasm file, got: {fp}")
             return
 
-        # Auto-save before build
+        # Auto-save before build (only if there are unsaved changes)
         idx = self._tabs.currentIndex()
-        self._save_file_at(idx)
+        if self._modified.get(idx):
+            self._save_file_at(idx)
 
         out_path = fp[:-5] + ".asm"
         self.output(f"Building: {fp} → {out_path}")
-        self.output("─" * 60)
+        self.output(_SEP_THIN)
 
         try:
             result = subprocess.run(
@@ -1821,11 +1860,12 @@ class MplabIDE(QMainWindow):
             return
 
         idx = self._tabs.currentIndex()
-        self._save_file_at(idx)
+        if self._modified.get(idx):
+            self._save_file_at(idx)
 
         out_path = fp[:-4] + ".rasm"
         self.output(f"Reverse translating ({lang}): {fp} → {out_path}")
-        self.output("─" * 60)
+        self.output(_SEP_THIN)
 
         try:
             result = subprocess.run(
@@ -1854,6 +1894,7 @@ class MplabIDE(QMainWindow):
             self._asm_type, self._asm_path = dlg.get_result()
             self._settings.setValue("assembler/type", self._asm_type)
             self._settings.setValue("assembler/path", self._asm_path)
+            self._update_asm_cmd_template()
             if self._asm_type != "none" and self._asm_path:
                 self.output(f"Assembler set: {self._asm_type} → {self._asm_path}")
             else:
@@ -1877,29 +1918,39 @@ class MplabIDE(QMainWindow):
             return False
         return True
 
-    def _build_asm_command(self, asm_file: str) -> list[str]:
-        """Build the command line for the configured assembler."""
-        asm_dir = str(Path(asm_file).parent)
-        asm_name = Path(asm_file).name
+    def _update_asm_cmd_template(self):
+        """Select the command-line builder for the configured assembler.
+
+        Called whenever the assembler type/path changes so that
+        _build_asm_command only has to fill in the file name.
+        """
+        asm_path = self._asm_path
+
+        def _hex_name(asm_name: str) -> str:
+            return os.path.splitext(asm_name)[0] + ".hex"
 
-        if self._asm_type == "mpasmx":
+        templates: dict[str, Callable[[str], list[str]]] = {
             # MPASM: mpasmx.exe /q /o- /l- <file.asm>
             #   /q  = quiet
             #   /o- = no object file (just hex)
             #   /l- = no listing file
-            return [self._asm_path, "/q", asm_name]
-
-        elif self._asm_type == "pic-as":
+            "mpasmx": lambda asm_name: [asm_path, "/q", asm_name],
             # XC8 pic-as: pic-as -o output.hex <file.asm>
-            hex_name = Path(asm_file).stem + ".hex"
-            return [self._asm_path, "-mcpu=PIC18F4550", "-o", hex_name, asm_name]
-
-        elif self._asm_type == "gpasm":
+            "pic-as": lambda asm_name: [
+                asm_path, "-mcpu=PIC18F4550", "-o", _hex_name(asm_name), asm_name,
+            ],
             # gputils: gpasm -o file.hex file.asm
-            hex_name = Path(asm_file).stem + ".hex"
-            return [self._asm_path, "-o", hex_name, asm_name]
+            "gpasm": lambda asm_name: [asm_path, "-o", _hex_name(asm_name), asm_name],
+        }
+        self._asm_cmd_template: Callable[[str], list[str]] | None = (
+            templates.get(self._asm_type)
+        )
 
-        return []
+    def _build_asm_command(self, asm_file: str) -> list[str]:
+        """Build the command line for the configured assembler."""
+        if self._asm_cmd_template is None:
+            return []
+        return self._asm_cmd_template(os.path.basename(asm_file))
 
     def _compile_asm_file(self, asm_file: str) -> bool:
         """Compile the given .asm file to .hex. Returns True on success."""
@@ -1912,10 +1963,10 @@ class MplabIDE(QMainWindow):
             return False
 
         asm_dir = str(Path(asm_file).parent)
-        self.output(f"Assembler: {self._asm_type}")
-        self.output(f"Command:   {' '.join(cmd)}")
-        self.output(f"Directory: {asm_dir}")
-        self.output("─" * 60)
+        self._out_buf.append(f"Assembler: {self._asm_type}")
+        self._out_buf.append(f"Command:   {' '.join(cmd)}")
+        self._out_buf.append(f"Directory: {asm_dir}")
+        self._out_buf.append(_SEP_THIN)
 
         try:
             result = subprocess.run(
@@ -1923,45 +1974,47 @@ class MplabIDE(QMainWindow):
                 cwd=asm_dir,
             )
             if result.stdout:
-                self.output(result.stdout.strip())
+                self._out_buf.append(result.stdout.strip())
             if result.stderr:
-                self.output(result.stderr.strip())
+                self._out_buf.append(result.stderr.strip())
             if result.returncode == 0:
                 hex_file = Path(asm_file).with_suffix(".hex")
                 # Check for generated .hex (MPASM may name it differently)
                 err_file = Path(asm_file).with_suffix(".err")
                 if hex_file.exists():
                     size = hex_file.stat().st_size
-                    self.output(f"Compile successful: {hex_file.name} ({size} bytes)")
+                    self._out_buf.append(f"Compile successful: {hex_file.name} ({size} bytes)")
                 else:
-                    self.output("Compile finished (exit code 0).")
+                    self._out_buf.append("Compile finished (exit code 0).")
                 # Show .err file contents if present (MPASM writes errors there)
                 if err_file.exists():
                     err_text = err_file.read_text(encoding="utf-8", errors="replace").strip()
                     if err_text:
-                        self.output("\n── Assembler Messages ──")
-                        self.output(err_text)
+                        self._out_buf.append("\n── Assembler Messages ──")
+                        self._out_buf.append(err_text)
                 return True
             else:
-                self.output(f"Compile FAILED (exit code {result.returncode}).")
+                self._out_buf.append(f"Compile FAILED (exit code {result.returncode}).")
                 # Show .err file if present
                 err_file = Path(asm_file).with_suffix(".err")
                 if err_file.exists():
                     err_text = err_file.read_text(encoding="utf-8", errors="replace").strip()
                     if err_text:
-                        self.output("\n── Assembler Errors ──")
-                        self.output(err_text)
+                        self._out_buf.append("\n── Assembler Errors ──")
+                        self._out_buf.append(err_text)
                 return False
         except FileNotFoundError:
-            self.output(f"ERROR: Assembler executable not found: {self._asm_path}")
-            self.output("Go to Tools → Assembler Settings to fix the path.")
+            self._out_buf.append(f"ERROR: Assembler executable not found: {self._asm_path}")
+            self._out_buf.append("Go to Tools → Assembler Settings to fix the path.")
             return False
         except subprocess.TimeoutExpired:
-            self.output("ERROR: Assembler timed out (60 s).")
+            self._out_buf.append("ERROR: Assembler timed out (60 s).")
             return False
         except Exception as e:
-            self.output(f"Compile error: {e}")
+            self._out_buf.append(f"Compile error: {e}")
             return False
+        finally:
+            self._flush_output()
 
     def _compile_current(self):
         """Compile current .asm file → .hex using the configured Microchip assembler."""
@@ -1978,10 +2031,11 @@ class MplabIDE(QMainWindow):
             return
 
         idx = self._tabs.currentIndex()
-        self._save_file_at(idx)
+        if self._modified.get(idx):
+            self._save_file_at(idx)
 
         self.output(f"Compiling: {fp}")
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
         self._compile_asm_file(fp)
         self.output("")
 
@@ -2000,37 +2054,22 @@ class MplabIDE(QMainWindow):
         if fp.lower().endswith(".rasm"):
             # Step 1: translate .rasm → .asm
             idx = self._tabs.currentIndex()
-            self._save_file_at(idx)
+            was_dirty = bool(self._modified.get(idx))
+            if was_dirty:
+                self._save_file_at(idx)
 
             asm_path = fp[:-5] + ".asm"
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
             self.output("  FULL BUILD: .rasm → .asm → .hex")
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
             self.output(f"\nStep 1: Translate {Path(fp).name} → {Path(asm_path).name}")
-            self.output("─" * 60)
-
-            try:
-                result = subprocess.run(
-                    [self._python, str(_TRANSLATOR), fp, "-o", asm_path],
-                    capture_output=True, text=True, timeout=30,
-                )
-                if result.stdout:
-                    self.output(result.stdout.strip())
-                if result.stderr:
-                    self.output(result.stderr.strip())
-                if result.returncode != 0:
-                    self.output(f"Translation failed (exit code {result.returncode}). Aborting.")
-                    self.output("")
-                    return
-                self.output("Translation successful.")
-            except Exception as e:
-                self.output(f"Translation error: {e}")
-                self.output("")
+            self.output(_SEP_THIN)
+            if not self._translate_step(fp, asm_path, was_dirty):
                 return
 
             # Step 2: compile .asm → .hex
             self.output(f"\nStep 2: Compile {Path(asm_path).name} → {Path(asm_path).stem}.hex")
-            self.output("─" * 60)
+            self.output(_SEP_THIN)
             self._compile_asm_file(asm_path)
             self.output("")
 
@@ -2040,11 +2079,69 @@ class MplabIDE(QMainWindow):
         else:
             self.output(f"Build All expects a .rasm or .asm file, got: {fp}")
 
+    @staticmethod
+    def _asm_is_up_to_date(rasm_path: str, asm_path: str) -> bool:
+        """True if *asm_path* is strictly newer than everything the translation reads.
+
+        That is the .rasm source, the translator with its shared helpers
+        module and both instruction JSON files (users may edit those to
+        rename instructions).  Equal mtimes count as stale: FAT/exFAT store
+        them with 2 s resolution, so a save right after a translation can
+        share the .asm's timestamp.
+        """
+        deps = (
+            rasm_path,
+            _TRANSLATOR,
+            _TRANSLATOR.parent / "pic18_common.py",
+            _INSTRUCTIONS_DIR / "pic18_instructions.json",
+            _INSTRUCTIONS_DIR / "pic16_instructions.json",
+        )
+        try:
+            asm_mtime = os.path.getmtime(asm_path)
+            return all(asm_mtime > os.path.getmtime(dep) for dep in deps)
+        except OSError:
+            return False
+
+    def _translate_step(self, fp: str, asm_path: str, was_dirty: bool) -> bool:
+        """Pipeline step: translate .rasm → .asm. Returns False to abort.
+
+        The translation is skipped when the editor buffer was clean and the
+        existing .asm is already newer than the source.
+        """
+        if not was_dirty and self._asm_is_up_to_date(fp, asm_path):
+            self.output(f"{Path(asm_path).name} is up to date — translation skipped.")
+            return True
+        try:
+            result = subprocess.run(
+                [self._python, str(_TRANSLATOR), fp, "-o", asm_path],
+                capture_output=True, text=True, timeout=30,
+            )
+            if result.stdout:
+                self._out_buf.append(result.stdout.strip())
+            if result.stderr:
+                self._out_buf.append(result.stderr.strip())
+            if result.returncode != 0:
+                self.output(f"Translation failed (exit code {result.returncode}). Aborting.")
+                self.output("")
+                return False
+            self.output("Translation successful.")
+            return True
+        except Exception as e:
+            self.output(f"Translation error: {e}")
+            self.output("")
+            return False
+
     def _show_reference(self):
         """Show instruction reference in output."""
-        self.output("=" * 60)
+        self.output(_SEP_EQ)
         self.output("  INSTRUCTION REFERENCE")
-        self.output("=" * 60)
+        self.output(_SEP_EQ)
+        # The reference table never changes during a session — run the
+        # translator once and serve later requests from memory.
+        if self._ref_cache is not None:
+            self.output(self._ref_cache)
+            self.output("")
+            return
         try:
             result = subprocess.run(
                 [self._python, str(_TRANSLATOR), "--ref"],
@@ -2052,6 +2149,8 @@ class MplabIDE(QMainWindow):
             )
             if result.stdout:
                 self.output(result.stdout)
+                if result.returncode == 0:
+                    self._ref_cache = result.stdout
             if result.stderr:
                 self.output(result.stderr)
         except Exception as e:
@@ -2097,10 +2196,10 @@ class MplabIDE(QMainWindow):
     def _run_programmer_cmd(self, cmd: list[str], action_label: str,
                             cwd: str | None = None) -> bool:
         """Run a programmer command and display output. Returns True on success."""
-        self.output(f"Programmer: {self._prog_type}  |  Device: {self._prog_device}")
-        self.output(f"Action:     {action_label}")
-        self.output(f"Command:    {' '.join(cmd)}")
-        self.output("─" * 60)
+        self._out_buf.append(f"Programmer: {self._prog_type}  |  Device: {self._prog_device}")
+        self._out_buf.append(f"Action:     {action_label}")
+        self._out_buf.append(f"Command:    {' '.join(cmd)}")
+        self._out_buf.append(_SEP_THIN)
 
         try:
             result = subprocess.run(
@@ -2108,25 +2207,27 @@ class MplabIDE(QMainWindow):
                 cwd=cwd,
             )
             if result.stdout:
-                self.output(result.stdout.strip())
+                self._out_buf.append(result.stdout.strip())
             if result.stderr:
-                self.output(result.stderr.strip())
+                self._out_buf.append(result.stderr.strip())
             if result.returncode == 0:
-                self.output(f"{action_label} completed successfully.")
+                self._out_buf.append(f"{action_label} completed successfully.")
                 return True
             else:
-                self.output(f"{action_label} FAILED (exit code {result.returncode}).")
+                self._out_buf.append(f"{action_label} FAILED (exit code {result.returncode}).")
                 return False
         except FileNotFoundError:
-            self.output(f"ERROR: Programmer executable not found: {self._prog_path}")
-            self.output("Go to Tools → Programmer → Programmer Settings.")
+            self._out_buf.append(f"ERROR: Programmer executable not found: {self._prog_path}")
+            self._out_buf.append("Go to Tools → Programmer → Programmer Settings.")
             return False
         except subprocess.TimeoutExpired:
-            self.output(f"ERROR: {action_label} timed out (120 s).")
+            self._out_buf.append(f"ERROR: {action_label} timed out (120 s).")
             return False
         except Exception as e:
-            self.output(f"{action_label} error: {e}")
+            self._out_buf.append(f"{action_label} error: {e}")
             return False
+        finally:
+            self._flush_output()
 
     def _find_hex_for_current(self) -> str | None:
         """Find the .hex file corresponding to the current editor file."""
@@ -2163,9 +2264,9 @@ class MplabIDE(QMainWindow):
         if not hex_path:
             return
 
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
         self.output("  PROGRAMMING DEVICE")
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
 
         cwd = str(Path(hex_path).parent)
 
@@ -2201,9 +2302,9 @@ class MplabIDE(QMainWindow):
         if not hex_path:
             return
 
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
         self.output("  VERIFYING DEVICE")
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
 
         cwd = str(Path(hex_path).parent)
 
@@ -2246,9 +2347,9 @@ class MplabIDE(QMainWindow):
         if reply != QMessageBox.Yes:
             return
 
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
         self.output("  ERASING DEVICE")
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
 
         if self._prog_type == "pk2cmd":
             cmd = [
@@ -2277,9 +2378,9 @@ class MplabIDE(QMainWindow):
         if not self._check_programmer():
             return
 
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
         self.output("  READING DEVICE ID")
-        self.output("═" * 60)
+        self.output(_SEP_THICK)
 
         if self._prog_type == "pk2cmd":
             cmd = [
@@ -2318,40 +2419,26 @@ class MplabIDE(QMainWindow):
         # Step 1 + 2: Build (translate + compile)
         if fp.lower().endswith(".rasm"):
             idx = self._tabs.currentIndex()
-            self._save_file_at(idx)
+            was_dirty = bool(self._modified.get(idx))
+            if was_dirty:
+                self._save_file_at(idx)
 
             asm_path = fp[:-5] + ".asm"
             hex_path = fp[:-5] + ".hex"
 
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
             self.output("  FULL BUILD & PROGRAM: .rasm → .asm → .hex → Device")
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
 
             # Step 1: translate
             self.output(f"\nStep 1: Translate {Path(fp).name} → {Path(asm_path).name}")
-            self.output("─" * 60)
-            try:
-                result = subprocess.run(
-                    [self._python, str(_TRANSLATOR), fp, "-o", asm_path],
-                    capture_output=True, text=True, timeout=30,
-                )
-                if result.stdout:
-                    self.output(result.stdout.strip())
-                if result.stderr:
-                    self.output(result.stderr.strip())
-                if result.returncode != 0:
-                    self.output(f"Translation failed (exit code {result.returncode}). Aborting.")
-                    self.output("")
-                    return
-                self.output("Translation successful.")
-            except Exception as e:
-                self.output(f"Translation error: {e}")
-                self.output("")
+            self.output(_SEP_THIN)
+            if not self._translate_step(fp, asm_path, was_dirty):
                 return
 
             # Step 2: compile
             self.output(f"\nStep 2: Compile {Path(asm_path).name} → {Path(asm_path).stem}.hex")
-            self.output("─" * 60)
+            self.output(_SEP_THIN)
             if not self._compile_asm_file(asm_path):
                 self.output("Compile failed. Aborting.")
                 self.output("")
@@ -2359,15 +2446,16 @@ class MplabIDE(QMainWindow):
 
         elif fp.lower().endswith(".asm"):
             idx = self._tabs.currentIndex()
-            self._save_file_at(idx)
+            if self._modified.get(idx):
+                self._save_file_at(idx)
             hex_path = fp[:-4] + ".hex"
 
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
             self.output("  BUILD & PROGRAM: .asm → .hex → Device")
-            self.output("═" * 60)
+            self.output(_SEP_THICK)
 
             self.output(f"\nStep 1: Compile {Path(fp).name} → {Path(fp).stem}.hex")
-            self.output("─" * 60)
+            self.output(_SEP_THIN)
             if not self._compile_asm_file(fp):
                 self.output("Compile failed. Aborting.")
                 self.output("")
@@ -2390,7 +2478,7 @@ class MplabIDE(QMainWindow):
 
         step_n = "Step 3" if fp.lower().endswith(".rasm") else "Step 2"
         self.output(f"\n{step_n}: Program {Path(hex_path).name} → {self._prog_device}")
-        self.output("─" * 60)
+        self.output(_SEP_THIN)
 
         cwd = str(Path(hex_path).parent)
         if self._prog_type == "pk2cmd":
@@ -2444,19 +2532,20 @@ class MplabIDE(QMainWindow):
     # ── close event ──────────────────────────────────────────────────────
 
     def closeEvent(self, event):
-        for i in range(self._tabs.count()):
-            if self._modified.get(i):
-                name = self._tabs.tabText(i).rstrip(" *")
-                reply = QMessageBox.question(
-                    self, "Save?",
-                    f"Save changes to {name}?",
-                    QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
-                )
-                if reply == QMessageBox.Save:
-                    self._save_file_at(i)
-                elif reply == QMessageBox.Cancel:
-                    event.ignore()
-                    return
+        # Only dirty tabs need a prompt — iterate a snapshot since saving
+        # a tab removes it from the set.
+        for i in sorted(self._dirty_indices):
+            name = self._tab_basename.get(i, "")
+            reply = QMessageBox.question(
+                self, "Save?",
+                f"Save changes to {name}?",
+                QMessageBox.Save | QMessageBox.Discard | QMessageBox.Cancel,
+            )
+            if reply == QMessageBox.Save:
+                self._save_file_at(i)
+            elif reply == QMessageBox.Cancel:
+                event.ignore()
+                return
         event.accept()
 
 
@@ -0,0 +1,69 @@
+"""
+PIC Readable Assembly — Shared Helpers
+======================================
+Text, stream and command-line helpers used by both pic18_translator and
+pic18_reverse_translator.
+
+Kept to the standard library modules the translators already load, so
+importing it adds nothing to their start-up time.
+"""
+
+import io
+import re
+from collections.abc import Callable
+
+try:
+    import ahocorasick  # optional, pyahocorasick
+except ImportError:
+    ahocorasick = None
+
+# Line boundaries recognised by str.splitlines(), folded to "\n" so the
+# MULTILINE anchors see the same lines.
+LINE_BREAK_RE = re.compile(r"\r\n?|[\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+# Read/write buffer size for the streaming CLI path (also the chunk size hint)
+STREAM_BUFFER = 1 << 20
+
+
+def ascii_safe(text: str) -> bool:
+    r"""True if re.ASCII cannot change how a pattern matches *text*.
+
+    That holds for ASCII text, except for \x1c-\x1f: Unicode \s matches
+    those separators but ASCII \s does not.
+    """
+    return text.isascii() and not any(c in text for c in "\x1c\x1d\x1e\x1f")
+
+
+def translate_chunks(src_file: io.TextIOBase, dst_file: io.TextIOBase,
+                     translate: Callable[[str], str]) -> None:
+    """Copy *src_file* to *dst_file* through *translate*, a chunk at a time.
+
+    Lines are read in chunks of about STREAM_BUFFER characters and each
+    translated chunk is followed by "\\n".  For a whole-source *translate*
+    that drops one trailing newline, the output matches
+    ``translate(src_file.read()) + "\\n"``.
+    """
+    wrote = False
+    while lines := src_file.readlines(STREAM_BUFFER):
+        dst_file.write(translate("".join(lines)))
+        dst_file.write("\n")
+        wrote = True
+    if not wrote:
+        dst_file.write("\n")
+
+
+def simple_args(argv: list[str]) -> tuple[str, str | None] | None:
+    """Return ``(input, output)`` for the plain ``input [-o output]`` forms.
+
+    Anything else (other options, help, file names starting with '-')
+    returns None and is left to argparse.
+    """
+    if len(argv) == 1:
+        input_path, output = argv[0], None
+    elif len(argv) == 3 and argv[1] in ("-o", "--output"):
+        input_path, output = argv[0], argv[2]
+    else:
+        return None
+    if input_path.startswith("-") or (output or "").startswith("-"):
+        return None
+    return input_path, output
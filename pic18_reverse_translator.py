@@ -19,13 +19,22 @@ Usage:
 If no output file is specified, the result is printed to stdout.
 """
 
+import functools
+import io
 import json
+import os
 import re
 import sys
-import argparse
-import io
+import types
+from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
 
+from pic18_common import (
+    LINE_BREAK_RE, STREAM_BUFFER, ahocorasick, ascii_safe, simple_args,
+    translate_chunks,
+)
+
 # =============================================================================
 # Load instruction maps from JSON files and build reverse maps
 # =============================================================================
@@ -40,20 +49,32 @@ def _load_json(filename: str) -> dict:
 _pic18_data = _load_json("pic18_instructions.json")
 _pic16_data = _load_json("pic16_instructions.json")
 
-def _invert(mapping: dict[str, str]) -> dict[str, str]:
-    """Invert a readable→mnemonic map to mnemonic→readable."""
-    return {v: k for k, v in mapping.items()}
+def _invert(mapping: dict[str, str]) -> Mapping[str, str]:
+    """Invert a readable→mnemonic map to a read-only mnemonic→readable map.
+
+    Keys and values are interned, so the EN/SI and PIC16/PIC18 maps share
+    one string object per mnemonic and per name.
+    """
+    return types.MappingProxyType(
+        {sys.intern(v): sys.intern(k) for k, v in mapping.items()}
+    )
+
+# Reverse maps: standard mnemonic → readable name (read-only)
+REVERSE_MAP_EN: Mapping[str, str]       = _invert(_pic18_data["en"])
+REVERSE_MAP_SI: Mapping[str, str]       = _invert(_pic18_data["si"])
+REVERSE_MAP_PIC16_EN: Mapping[str, str] = _invert(_pic16_data["en"])
+REVERSE_MAP_PIC16_SI: Mapping[str, str] = _invert(_pic16_data["si"])
 
-# Reverse maps: standard mnemonic → readable name
-REVERSE_MAP_EN: dict[str, str]       = _invert(_pic18_data["en"])
-REVERSE_MAP_SI: dict[str, str]       = _invert(_pic18_data["si"])
-REVERSE_MAP_PIC16_EN: dict[str, str] = _invert(_pic16_data["en"])
-REVERSE_MAP_PIC16_SI: dict[str, str] = _invert(_pic16_data["si"])
+# Merged PIC18 + PIC16 reverse maps per target language (PIC16 wins on overlap)
+_MERGED: dict[str, Mapping[str, str]] = {
+    "en": types.MappingProxyType({**REVERSE_MAP_EN, **REVERSE_MAP_PIC16_EN}),
+    "si": types.MappingProxyType({**REVERSE_MAP_SI, **REVERSE_MAP_PIC16_SI}),
+}
 
 # =============================================================================
 # Assembler directives / pseudo-ops that should NOT be translated
 # =============================================================================
-_DIRECTIVES = {
+_DIRECTIVES = frozenset(sys.intern(d) for d in {
     "LIST", "INCLUDE", "#INCLUDE", "CONFIG", "ORG", "EQU", "SET", "CONSTANT",
     "VARIABLE", "CBLOCK", "ENDC", "DB", "DW", "DE", "DT", "DATA", "RES",
     "FILL", "IF", "ELSE", "ENDIF", "IFDEF", "IFNDEF", "WHILE", "ENDW",
@@ -61,176 +82,448 @@ _DIRECTIVES = {
     "ERROR", "ERRORLEVEL", "PAGE", "TITLE", "SUBTITLE", "SPACE", "NOLIST",
     "RADIX", "PROCESSOR", "END", "BANKSEL", "BANKISEL", "PAGESEL",
     "__CONFIG", "__IDLOCS", "__BADRAM", "__MAXRAM",
-}
+})
+
+# The combined regex runs over a whole source with re.MULTILINE, so
+# whitespace inside a line is matched with [^\S\n] (never crosses a newline).
+
+# Regex arm matching a comment-only line, passed through unchanged.
+_COMMENT_PATTERN = r"(?P<cmt>^[^\S\n]*;.*$)"
+
+# Regex arm matching a whole line whose first non-label token (labels are
+# tokens ending in ':') is a directive, optionally dot-prefixed, or any
+# '#'-prefixed token.  Such lines are passed through unchanged.
+_DIRECTIVE_PATTERN = (
+    r"(?P<dir>^[^\S\n]*(?:\S*:[^\S\n]+)*"
+    r"(?:#(?:\S*[^\s:])?|\.*(?:"
+    + "|".join(re.escape(d) for d in sorted(_DIRECTIVES, key=len, reverse=True))
+    + r"))(?!\S).*$)"
+)
 
 
-def _build_reverse_regex() -> re.Pattern:
-    """Build a regex that matches any standard PIC16/PIC18 mnemonic.
+# All standard mnemonics (PIC18 + PIC16)
+_ALL_MNEMONICS = frozenset(REVERSE_MAP_EN) | frozenset(REVERSE_MAP_PIC16_EN)
+
+# Identifier scan used to find which mnemonics occur in a source file.
+_WORD_RE = re.compile(r"[A-Z_][A-Z0-9_]*")
+
+# Leading identifier → mnemonics starting with it.  Table instructions
+# (TBLRD*+ etc.) are only seen as "TBLRD" by _WORD_RE.
+_MNEMONICS_BY_WORD: dict[str, frozenset[str]] = {}
+for _m in _ALL_MNEMONICS:
+    _w = _WORD_RE.match(_m).group(0)
+    _MNEMONICS_BY_WORD[_w] = _MNEMONICS_BY_WORD.get(_w, frozenset()) | {_m}
+del _m, _w
+
+# Aho-Corasick automaton over all mnemonics: finds every mnemonic occurring
+# in a source in one linear scan.  None when pyahocorasick is missing.
+_MNEMONIC_AUTOMATON = None
+if ahocorasick is not None:
+    _MNEMONIC_AUTOMATON = ahocorasick.Automaton()
+    for _m in _ALL_MNEMONICS:
+        _MNEMONIC_AUTOMATON.add_word(_m, _m)
+    _MNEMONIC_AUTOMATON.make_automaton()
+    del _m
+
+
+# =============================================================================
+# Assignment-syntax generation for MOVLW / MOVWF / MOVFF
+# =============================================================================
+# Regex arm that matches MOVLW, MOVWF, MOVFF as the instruction on a line.
+# Captures: indent, optional label, the mnemonic (group mlw, mwf or mff),
+# operands, optional comment.
+# MOVFF only matches when it has both operands (a ',' before any ';');
+# otherwise the line is handled like any other mnemonic.
+_MOV_ASSIGN_PATTERN = (
+    r"(?P<mov>^(?P<indent>[^\S\n]*)"
+    r"(?:(?P<label>\w+):[^\S\n]*)?"
+    r"(?:(?P<mlw>MOVLW)|(?P<mwf>MOVWF)|(?P<mff>MOVFF)(?=[^\S\n]+[^;,\n]*,))[^\S\n]+"
+    r"(?P<operands>[^;\n]+?)"
+    r"(?P<comment>[^\S\n]*;.*)?"
+    r"$)"
+)
+
+# The MOV* arm on its own, used to re-parse a cached line.
+_MOV_LINE_RE = re.compile(_MOV_ASSIGN_PATTERN, re.IGNORECASE)
+
+
+# (mnemonic, escaped mnemonic) pairs, longest first, sorted and escaped once
+# at import so the narrowed patterns built per source only filter this tuple.
+_ESCAPED_BY_LENGTH = tuple(
+    (m, re.escape(m)) for m in sorted(_ALL_MNEMONICS, key=lambda m: (-len(m), m))
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_mnemonic_regex(mnemonics: frozenset[str], flags: int = 0) -> re.Pattern:
+    """Compile the source-wide regex for the given standard mnemonics.
+
+    The pattern has four arms: the comment arm (group ``cmt``), the
+    directive arm (group ``dir``) and the MOV* assignment arm (group
+    ``mov``), which all match a whole line, and the plain mnemonic arm
+    (group ``std``), so a single MULTILINE ``sub`` handles every case.
 
     Table instructions (TBLRD*+, TBLWT+*, etc.) require special handling
     because they contain regex metacharacters (* and +).
     Longer mnemonics are tried first to avoid partial matches
     (e.g. TBLRD*+ before TBLRD*).
     """
-    # Merge PIC18 + PIC16 mnemonics
-    all_mnemonics = set(REVERSE_MAP_EN.keys()) | set(REVERSE_MAP_PIC16_EN.keys())
-    sorted_mnemonics = sorted(all_mnemonics, key=len, reverse=True)
-    pattern = "|".join(re.escape(m) for m in sorted_mnemonics)
+    if mnemonics:
+        pattern = "|".join([esc for m, esc in _ESCAPED_BY_LENGTH if m in mnemonics])
+    else:
+        pattern = r"(?!)"  # never matches
     return re.compile(
-        r"(?<!\w)(" + pattern + r")(?!\w)",
-        re.IGNORECASE,
+        _COMMENT_PATTERN + "|" + _DIRECTIVE_PATTERN + "|" + _MOV_ASSIGN_PATTERN
+        + r"|(?<!\w)(?P<std>" + pattern + r")(?!\w)",
+        flags | re.MULTILINE,
     )
 
 
-_STD_MNEMONIC_RE = _build_reverse_regex()
+@functools.lru_cache(maxsize=None)
+def _build_reverse_regex() -> re.Pattern:
+    """Build a case-insensitive regex that matches any standard PIC16/PIC18 mnemonic.
 
+    Built on first use: the whole-source path only needs the narrowed
+    patterns from _active_mnemonic_regex.
+    """
+    return _compile_mnemonic_regex(_ALL_MNEMONICS, re.IGNORECASE)
 
-# =============================================================================
-# Assignment-syntax generation for MOVLW / MOVWF / MOVFF
-# =============================================================================
-# Regex to match MOVLW, MOVWF, MOVFF as the instruction on a line.
-# Captures: indent, optional label, mnemonic, operands, optional comment.
-_MOV_ASSIGN_RE = re.compile(
-    r"^(?P<indent>\s*)"
-    r"(?:(?P<label>\w+):\s*)?"
-    r"(?P<mnemonic>MOVLW|MOVWF|MOVFF)\s+"
-    r"(?P<operands>[^;]+?)"
-    r"(?P<comment>\s*;.*)?"
-    r"$",
-    re.IGNORECASE,
-)
 
+def _active_mnemonic_regex(folded: str, flags: int = 0) -> re.Pattern:
+    """Build a regex specialised to the mnemonics that occur in *folded*.
+
+    *folded* is the upper-cased source.
+    Most files use only a small subset of the instruction set, so the
+    resulting alternation is much shorter than _build_reverse_regex().
+    Patterns are cached by mnemonic set.
+
+    Uses _MNEMONIC_AUTOMATON when available.  It may report mnemonics that
+    appear inside longer words; the regex word boundaries filter those.
+    """
+    if _MNEMONIC_AUTOMATON is not None:
+        active = {m for _, m in _MNEMONIC_AUTOMATON.iter(folded)}
+        return _compile_mnemonic_regex(frozenset(active), flags)
+
+    active: set[str] = set()
+    for word in set(_WORD_RE.findall(folded)):
+        hits = _MNEMONICS_BY_WORD.get(word)
+        if hits:
+            active |= hits
+    return _compile_mnemonic_regex(frozenset(active), flags)
 
-def _reverse_assignment(line: str) -> str | None:
-    """Try to convert MOVLW/MOVWF/MOVFF to assignment syntax.
 
-    Returns None if the line does not match.
+def _reverse_assignment(m: re.Match) -> str:
+    """Convert a MOVLW/MOVWF/MOVFF match (``mov`` arm) to assignment syntax.
 
     Conversion rules:
       MOVLW <literal>        →  wreg = <literal>
       MOVWF <dest>[, access] →  <dest> = wreg[, access]
       MOVFF <src>, <dest>    →  <dest> = <src>
     """
-    m = _MOV_ASSIGN_RE.match(line.rstrip("\n\r"))
-    if not m:
-        return None
+    indent, label, operands, comment, mlw, mwf = m.group(
+        "indent", "label", "operands", "comment", "mlw", "mwf")
+    operands = operands.strip()
+    comment = comment.rstrip() if comment else ""
+    label_prefix = label + ": " if label else ""
 
-    indent = m.group("indent") or ""
-    label = m.group("label")
-    mnemonic = m.group("mnemonic").upper()
-    operands = m.group("operands").strip()
-    comment = (m.group("comment") or "").rstrip()
+    if mlw:
+        return "".join((indent, label_prefix, "wreg = ", operands, comment))
 
-    label_prefix = f"{label}: " if label else ""
+    first, sep, rest = operands.partition(",")
+    if mwf:
+        # MOVWF <dest>[, ACCESS/BANKED]
+        extra = ", " + rest.strip() if sep else ""
+        return "".join((indent, label_prefix, first.strip(), " = wreg", extra, comment))
 
-    if mnemonic == "MOVLW":
-        return f"{indent}{label_prefix}wreg = {operands}{comment}"
+    # MOVFF <src>, <dest>
+    return "".join((indent, label_prefix, rest.strip(), " = ", first.strip(), comment))
 
-    if mnemonic == "MOVWF":
-        # MOVWF <dest>[, ACCESS/BANKED]
-        parts = [p.strip() for p in operands.split(",", 1)]
-        dest = parts[0]
-        extra = f", {parts[1]}" if len(parts) > 1 else ""
-        return f"{indent}{label_prefix}{dest} = wreg{extra}{comment}"
 
-    if mnemonic == "MOVFF":
-        # MOVFF <src>, <dest>
-        parts = [p.strip() for p in operands.split(",", 1)]
-        if len(parts) == 2:
-            src, dest = parts
-            return f"{indent}{label_prefix}{dest} = {src}{comment}"
+@functools.lru_cache(maxsize=8192)
+def _assignment_line_cached(line: str) -> str:
+    """Memoised _reverse_assignment, keyed by the text of a MOV* line.
+
+    Listings repeat the same MOVLW/MOVWF/MOVFF lines often, so most calls
+    skip the group extraction and formatting.  The result does not depend
+    on the language.  Use ``_assignment_line_cached.cache_clear()`` to reset.
+    """
+    return _reverse_assignment(_MOV_LINE_RE.match(line))
 
-    return None
 
+def _make_replacer(rev_map: Mapping[str, str]):
+    """Return the ``sub`` callback for the combined regex and *rev_map*.
+
+    Mnemonics are looked up upper-cased, so the pattern may be matched
+    with re.IGNORECASE.
+    """
+    # Hot names bound as closure locals (LOAD_DEREF instead of LOAD_GLOBAL)
+    rev_get = rev_map.get
+    assignment = _assignment_line_cached
 
-def reverse_translate_line(line: str, rev_map: dict[str, str]) -> str:
+    def _replace(m: re.Match) -> str:
+        # Each arm is one top-level group, so lastgroup names the arm that
+        # matched (the mov arm's inner groups close before it does).
+        kind = m.lastgroup
+        text = m.group(0)
+        if kind == "std":
+            return rev_get(text.upper(), text)
+        if kind == "mov":
+            return assignment(text)
+        return text             # comment or directive line
+    return _replace
+
+
+# Per-language sub callbacks, built once at import
+_REPLACERS = {lang: _make_replacer(_MERGED[lang]) for lang in _MERGED}
+
+
+# sub callbacks for caller-supplied maps, keyed by id().  Each entry keeps
+# its map alive, so an id is never reused while it is cached.
+_CUSTOM_REPLACERS: dict[int, tuple[Mapping[str, str], object]] = {}
+_CUSTOM_REPLACERS_MAX = 8
+
+
+def _replacer_for(rev_map: Mapping[str, str]):
+    """Return the cached ``sub`` callback for a caller-supplied *rev_map*."""
+    entry = _CUSTOM_REPLACERS.get(id(rev_map))
+    if entry is not None and entry[0] is rev_map:
+        return entry[1]
+    if len(_CUSTOM_REPLACERS) >= _CUSTOM_REPLACERS_MAX:
+        del _CUSTOM_REPLACERS[next(iter(_CUSTOM_REPLACERS))]
+    replace = _make_replacer(rev_map)
+    _CUSTOM_REPLACERS[id(rev_map)] = (rev_map, replace)
+    return replace
+
+
+def reverse_translate_line(line: str, rev_map: Mapping[str, str]) -> str:
     """Translate one line of standard PIC18 assembly into readable assembly.
 
     Assignment-syntax is used for MOVLW, MOVWF, and MOVFF.
     Other mnemonics are replaced with readable names.
     Labels, comments, directives, and operands are preserved verbatim.
+
+    Results for the merged per-language maps are cached by line (see
+    reverse_translate_line_en / _si); other maps reuse a cached ``sub``
+    callback but translate every call.
     """
+    for lang, merged in _MERGED.items():
+        if merged is rev_map:
+            return _CACHED_LINE_TRANSLATORS[lang](line)
+    return _reverse_translate_line(line, _build_reverse_regex(), _replacer_for(rev_map))
+
+
+def _reverse_translate_line(line: str, mnemonic_re: re.Pattern, replace) -> str:
+    """reverse_translate_line with the ``sub`` callback already chosen."""
     stripped = line.rstrip("\n\r")
 
-    # Fast path: empty or comment-only lines
-    if stripped.strip() == "" or stripped.lstrip().startswith(";"):
+    # Fast path: empty, whitespace-only or comment-only lines
+    body = stripped.lstrip()
+    if not body or body[0] == ";":
         return stripped
 
-    # Check if the first non-label token is a directive → pass through
-    tokens = stripped.split()
-    for tok in tokens:
-        if tok.endswith(":"):
-            continue  # skip label
-        upper_tok = tok.upper().lstrip(".")
-        if upper_tok in _DIRECTIVES or tok.startswith("#"):
+    # Fast path: leading '#' token or (dot-prefixed) directive.  Lines
+    # starting with a label are left to the regex's directive arm.
+    tok = body.split(None, 1)[0]
+    if tok[0] == "#":
+        if tok[-1] != ":":
             return stripped
-        break
+    elif tok.isascii() and tok.lstrip(".").upper() in _DIRECTIVES:
+        return stripped
 
-    # ── Try assignment syntax for MOVLW/MOVWF/MOVFF first ──
-    result = _reverse_assignment(stripped)
-    if result is not None:
-        return result
+    return mnemonic_re.sub(replace, stripped)
 
-    # ── Standard mnemonic replacement ──
-    def _replace(m: re.Match) -> str:
-        key = m.group(1).upper()
-        return rev_map.get(key, m.group(0))
 
-    return _STD_MNEMONIC_RE.sub(_replace, stripped)
+@functools.lru_cache(maxsize=8192)
+def reverse_translate_line_en(line: str) -> str:
+    """reverse_translate_line specialised to English names (cached by line)."""
+    return _reverse_translate_line(line, _build_reverse_regex(), _REPLACERS["en"])
+
+
+@functools.lru_cache(maxsize=8192)
+def reverse_translate_line_si(line: str) -> str:
+    """reverse_translate_line specialised to Slovenian names (cached by line)."""
+    return _reverse_translate_line(line, _build_reverse_regex(), _REPLACERS["si"])
+
+
+_CACHED_LINE_TRANSLATORS = {"en": reverse_translate_line_en, "si": reverse_translate_line_si}
+
+
+def _translate_chunk(chunk: str, lang: str) -> str:
+    """Translate a run of whole, "\n"-separated lines (*lang* must be valid).
+
+    The combined regex runs on ``chunk.upper()`` without re.IGNORECASE and
+    the replacements are spliced into *chunk*, so the case of operands,
+    comments and directive lines is kept.
+    """
+    folded = chunk.upper()
+    if len(folded) != len(chunk):
+        # Upper-casing changed the length (e.g. 'ß'), so spans would not
+        # line up; match case-insensitively on the original instead.
+        return _active_mnemonic_regex(folded, re.IGNORECASE).sub(_REPLACERS[lang], chunk)
+
+    rev_get = _MERGED[lang].get
+    parts: list[str] = []
+    pos = 0
+    # The ASCII character tables are quicker to test where they give the
+    # same result
+    flags = re.ASCII if ascii_safe(folded) else 0
+    for m in _active_mnemonic_regex(folded, flags).finditer(folded):
+        kind = m.lastgroup
+        if kind == "std":
+            readable = rev_get(m.group(0))
+            if readable is None:
+                continue
+        elif kind == "mov":
+            readable = _assignment_line_cached(chunk[m.start():m.end()])
+        else:
+            continue            # comment or directive line, copied as is
+        parts.append(chunk[pos:m.start()])
+        parts.append(readable)
+        pos = m.end()
+    parts.append(chunk[pos:])
+    return "".join(parts)
+
+
+# Sources at least this large are split across worker processes when the
+# PIC_PARALLEL=1 environment variable is set.
+_PARALLEL_MIN_SIZE = 512 * 1024
+
+
+def _normalize_source(source: str) -> str:
+    """Fold every line break to "\n" and drop one trailing newline."""
+    source = LINE_BREAK_RE.sub("\n", source)
+    if source.endswith("\n"):
+        source = source[:-1]
+    return source
+
+
+def _translate_source_chunk(text: str, lang: str) -> str:
+    """reverse_translate of one stream chunk, minus the parallel split.
+
+    Runs in the worker processes of _translate_stream_parallel.
+    """
+    return _translate_chunk(_normalize_source(text), lang)
 
 
 def reverse_translate(source: str, lang: str = "en") -> str:
     """Translate a full standard PIC16/PIC18 assembly source to readable assembly.
 
+    The whole source is rewritten by a single MULTILINE ``sub``.  Large
+    sources are split across processes when PIC_PARALLEL=1 is set (see
+    _translate_stream_parallel).
+
     Args:
         source: The standard assembly source code.
         lang:   "en" for English readable names, "si" for Slovenian.
     """
-    if lang == "si":
-        rev_map = {**REVERSE_MAP_SI, **REVERSE_MAP_PIC16_SI}
-    else:
-        rev_map = {**REVERSE_MAP_EN, **REVERSE_MAP_PIC16_EN}
-    return "\n".join(
-        reverse_translate_line(line, rev_map) for line in source.splitlines()
-    )
+    if lang not in _MERGED:
+        lang = "en"
+    if len(source) >= _PARALLEL_MIN_SIZE and os.environ.get("PIC_PARALLEL") == "1":
+        # The stream output is this function's result plus one "\n"
+        out = io.StringIO()
+        _translate_stream_parallel(io.StringIO(source), out, lang)
+        return out.getvalue()[:-1]
+    return _translate_chunk(_normalize_source(source), lang)
 
 
-# ── CLI ─────────────────────────────────────────────────────────────────
-def main() -> None:
-    parser = argparse.ArgumentParser(
-        description="Convert standard PIC16/PIC18 assembly (.asm) to readable assembly (.rasm).",
-    )
-    parser.add_argument(
-        "input",
-        help="Input file with standard PIC18 assembly (.asm).",
-    )
-    parser.add_argument(
-        "-o", "--output",
-        help="Output file for the readable assembly (.rasm).  Defaults to stdout.",
-    )
-    parser.add_argument(
-        "--lang",
-        choices=["en", "si"],
-        default="en",
-        help="Target language for readable names: 'en' (English, default) or 'si' (Slovenian).",
-    )
-    args = parser.parse_args()
+def reverse_translate_stream(src_file: io.TextIOBase, dst_file: io.TextIOBase, lang: str = "en") -> None:
+    """Translate *src_file* to *dst_file* without holding the whole source.
+
+    Lines are read in chunks of about STREAM_BUFFER characters; each chunk
+    goes through reverse_translate.  The output matches
+    ``reverse_translate(src_file.read(), lang) + "\n"``.
 
-    with open(args.input, "r", encoding="utf-8") as f:
-        source = f.read()
+    With PIC_PARALLEL=1 the chunks are translated on one process pool
+    shared by the whole stream (see _translate_stream_parallel).
+    """
+    if os.environ.get("PIC_PARALLEL") == "1":
+        _translate_stream_parallel(src_file, dst_file, lang)
+        return
+    translate_chunks(src_file, dst_file, functools.partial(reverse_translate, lang=lang))
+
+
+# Read size hint for the parallel stream; several chunks per worker keep
+# every core busy.
+_PARALLEL_CHUNK = 256 * 1024
 
-    result = reverse_translate(source, lang=args.lang)
+
+def _translate_stream_parallel(src_file: io.TextIOBase, dst_file: io.TextIOBase, lang: str) -> None:
+    """reverse_translate_stream with the chunks spread over worker processes.
+
+    One pool serves the whole stream, and at most two chunks per worker are
+    in flight.  Sources smaller than _PARALLEL_MIN_SIZE are translated in
+    this process without starting a pool.
+    """
+    if lang not in _MERGED:
+        lang = "en"
+    chunks: list[str] = []
+    size = 0
+    while size < _PARALLEL_MIN_SIZE and (lines := src_file.readlines(_PARALLEL_CHUNK)):
+        chunks.append("".join(lines))
+        size += len(chunks[-1])
+    if size < _PARALLEL_MIN_SIZE:
+        dst_file.write(_translate_source_chunk("".join(chunks), lang))
+        dst_file.write("\n")
+        return
+
+    # Imported here: concurrent.futures.process pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    k = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=k) as ex:
+        pending = deque(ex.submit(_translate_source_chunk, c, lang) for c in chunks)
+        del chunks
+        while lines := src_file.readlines(_PARALLEL_CHUNK):
+            pending.append(ex.submit(_translate_source_chunk, "".join(lines), lang))
+            while len(pending) > 2 * k:
+                dst_file.write(pending.popleft().result())
+                dst_file.write("\n")
+        while pending:
+            dst_file.write(pending.popleft().result())
+            dst_file.write("\n")
+
+
+# ── CLI ─────────────────────────────────────────────────────────────────
+def main() -> None:
+    # Plain "input [-o output]" calls (build scripts translating many files)
+    # skip building the ArgumentParser.
+    simple = simple_args(sys.argv[1:])
+    if simple is not None:
+        args = types.SimpleNamespace(input=simple[0], output=simple[1], lang="en")
+    else:
+        import argparse  # only needed here; keeps library imports light
+
+        parser = argparse.ArgumentParser(
+            description="Convert standard PIC16/PIC18 assembly (.asm) to readable assembly (.rasm).",
+        )
+        parser.add_argument(
+            "input",
+            help="Input file with standard PIC18 assembly (.asm).",
+        )
+        parser.add_argument(
+            "-o", "--output",
+            help="Output file for the readable assembly (.rasm).  Defaults to stdout.",
+        )
+        parser.add_argument(
+            "--lang",
+            choices=["en", "si"],
+            default="en",
+            help="Target language for readable names: 'en' (English, default) or 'si' (Slovenian).",
+        )
+        args = parser.parse_args()
+
+    # UTF-8 stdout avoids cp1250 encoding issues on Windows
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
     if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(result + "\n")
-        out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-        out.write(f"Readable assembly written to: {args.output}\n")
-        out.flush()
+        with open(args.input, "r", encoding="utf-8", buffering=STREAM_BUFFER) as src, \
+             open(args.output, "w", encoding="utf-8", buffering=STREAM_BUFFER) as dst:
+            reverse_translate_stream(src, dst, lang=args.lang)
+        print(f"Readable assembly written to: {args.output}")
     else:
-        out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-        out.write(result + "\n")
-        out.flush()
+        with open(args.input, "r", encoding="utf-8", buffering=STREAM_BUFFER) as src:
+            reverse_translate_stream(src, sys.stdout, lang=args.lang)
 
 
 if __name__ == "__main__":
@@ -24,9 +24,17 @@ If no output file is specified, the result is printed to stdout.
 import json
 import re
 import sys
-import argparse
+import functools
+import io
+import types
+from collections.abc import Iterable, Iterator, Mapping
 from pathlib import Path
 
+from pic18_common import (
+    LINE_BREAK_RE, STREAM_BUFFER, ahocorasick, ascii_safe, simple_args,
+    translate_chunks,
+)
+
 # =============================================================================
 # Load instruction maps from JSON files
 # =============================================================================
@@ -41,33 +49,40 @@ def _load_json(filename: str) -> dict:
 _pic18_data = _load_json("pic18_instructions.json")
 _pic16_data = _load_json("pic16_instructions.json")
 
-# Forward maps: readable name → standard mnemonic
-INSTRUCTION_MAP: dict[str, str]          = _pic18_data["en"]
-INSTRUCTION_MAP_SI: dict[str, str]       = _pic18_data["si"]
-INSTRUCTION_MAP_PIC16: dict[str, str]    = _pic16_data["en"]
-INSTRUCTION_MAP_PIC16_SI: dict[str, str] = _pic16_data["si"]
+
+def _interned(m: dict[str, str]) -> dict[str, str]:
+    """Return *m* with every name and mnemonic interned."""
+    return {sys.intern(k): sys.intern(v) for k, v in m.items()}
+
+
+# Forward maps: readable name → standard mnemonic.  Interned, so the maps
+# below share one object per name and per mnemonic.
+INSTRUCTION_MAP: dict[str, str]          = _interned(_pic18_data["en"])
+INSTRUCTION_MAP_SI: dict[str, str]       = _interned(_pic18_data["si"])
+INSTRUCTION_MAP_PIC16: dict[str, str]    = _interned(_pic16_data["en"])
+INSTRUCTION_MAP_PIC16_SI: dict[str, str] = _interned(_pic16_data["si"])
 
 # =============================================================================
 # Merged map: all readable names (PIC18 EN/SI + PIC16 EN/SI) → standard mnemonic
 # =============================================================================
-INSTRUCTION_MAP_ALL: dict[str, str] = {
-    **INSTRUCTION_MAP,
-    **INSTRUCTION_MAP_SI,
-    **INSTRUCTION_MAP_PIC16,
-    **INSTRUCTION_MAP_PIC16_SI,
-}
-
-# Build reverse map (standard → readable) for reference / future use
-REVERSE_MAP: dict[str, str] = {v: k for k, v in INSTRUCTION_MAP.items()}
-
-# Pre-compile a single regex that matches any readable mnemonic at a word
-# boundary.  Longer names are tried first so that e.g.
-# "add_literal_to_fsr2_and_return" is matched before "add_literal_to_fsr".
-_SORTED_KEYS = sorted(INSTRUCTION_MAP_ALL.keys(), key=len, reverse=True)
-_MNEMONIC_RE = re.compile(
-    r"(?<!\w)(" + "|".join(re.escape(k) for k in _SORTED_KEYS) + r")(?!\w)",
-    re.IGNORECASE,
-)
+# Later maps win on overlap.  The translation code uses the private dict;
+# the public name is a read-only view of it.
+_NAME_MAP: dict[str, str] = dict(INSTRUCTION_MAP)
+for _m in (INSTRUCTION_MAP_SI, INSTRUCTION_MAP_PIC16, INSTRUCTION_MAP_PIC16_SI):
+    _NAME_MAP.update(_m)
+del _m
+INSTRUCTION_MAP_ALL: Mapping[str, str] = types.MappingProxyType(_NAME_MAP)
+
+
+# Reverse map (standard → readable) for reference / future use.  Nothing in
+# this module reads it, so it is built on first access (PEP 562).
+def __getattr__(name: str):
+    if name == "REVERSE_MAP":
+        global REVERSE_MAP
+        REVERSE_MAP = {v: k for k, v in INSTRUCTION_MAP.items()}
+        return REVERSE_MAP
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # =============================================================================
 # Assignment-syntax support  (wreg = 0x04  →  MOVLW 0x04)
@@ -76,15 +91,18 @@ _MNEMONIC_RE = re.compile(
 # =============================================================================
 # The regex matches:  <lhs> = <rhs>  with optional whitespace around '='.
 # <lhs> and <rhs> may be register/variable names, literals, ACCESS/BANKED, etc.
-_ASSIGNMENT_RE = re.compile(
-    r"^(?P<indent>\s*)"
-    r"(?:(?P<label>\w+):\s*)?"
+# Whitespace is matched with [^\S\n] so the pattern never crosses a line
+# when used on a whole source (see _MNEMONIC_RE).
+_ASSIGNMENT_PATTERN = (
+    r"^(?P<indent>[^\S\n]*)"
+    r"(?:(?P<label>\w+):[^\S\n]*)?"
     r"(?P<lhs>[\w.]+)"
-    r"\s*=\s*"
-    r"(?P<rhs>[^;]+?)"
-    r"(?P<comment>\s*;.*)?"
-    r"$",
+    r"[^\S\n]*=[^\S\n]*"
+    r"(?P<rhs>[^;\n]+?)"
+    r"(?P<comment>[^\S\n]*;.*)?"
+    r"$"
 )
+_ASSIGNMENT_RE = re.compile(_ASSIGNMENT_PATTERN)
 
 # Known names that refer to the W register (case-insensitive)
 _WREG_NAMES = {"wreg", "w"}
@@ -103,7 +121,11 @@ def _translate_assignment(line: str) -> str | None:
     m = _ASSIGNMENT_RE.match(line.rstrip("\n\r"))
     if not m:
         return None
+    return _assignment_from_match(m)
+
 
+def _assignment_from_match(m: re.Match) -> str:
+    """Build the MOVLW/MOVWF/MOVFF line for an assignment match."""
     indent = m.group("indent") or ""
     label = m.group("label")
     lhs = m.group("lhs").strip()
@@ -135,6 +157,137 @@ def _translate_assignment(line: str) -> str | None:
     return f"{indent}{label_prefix}MOVFF {rhs_val}, {lhs}{comment}"
 
 
+# =============================================================================
+# Combined source-wide regex
+# =============================================================================
+# One MULTILINE pattern with three arms, so a single ``sub`` rewrites a whole
+# source: comment-only lines (group ``cmt``, passed through), assignment
+# lines (group ``asg``) and readable mnemonics anywhere else (group ``std``).
+# At a line start the arms are tried in that order, which mirrors the
+# per-line rules of translate_line.
+#
+# The ``std`` arm matches any word shaped like a readable name and the map
+# lookup decides; a name then has to span a whole word.  A generic word
+# pattern scans much faster than an alternation of every name.
+#
+# The pattern is normally run on lower-cased text without re.IGNORECASE
+# (see _translate_text); readable names are all lower-case already.
+_NAME_WORD = r"[a-z]+_\w*"
+if not all(re.fullmatch(_NAME_WORD, k) for k in _NAME_MAP):
+    _NAME_WORD = r"\w+"
+
+_MNEMONIC_RE = re.compile(
+    r"(?P<cmt>^[^\S\n]*;.*$)"
+    r"|(?P<asg>" + _ASSIGNMENT_PATTERN + r")"
+    r"|(?<!\w)(?P<std>" + _NAME_WORD + r")(?!\w)",
+    re.MULTILINE,
+)
+_MNEMONIC_RE_CI = re.compile(_MNEMONIC_RE.pattern, re.MULTILINE | re.IGNORECASE)
+# For ASCII text (see ascii_safe); the ASCII character tables are quicker
+# to test.
+_MNEMONIC_RE_ASCII = re.compile(_MNEMONIC_RE.pattern, re.MULTILINE | re.ASCII)
+
+
+# A character every readable name contains ("" if there is none).  Text
+# without it and without '=' cannot match, so the regex is skipped.
+_NAME_MARKER = "_" if all("_" in k for k in _NAME_MAP) else ""
+
+# Aho-Corasick automaton over all readable names: finds every name occurring
+# in a line in one linear scan (see translate_line).  Values are
+# (name, mnemonic) pairs.  None when pyahocorasick is missing.
+_NAME_AUTOMATON = None
+if ahocorasick is not None:
+    _NAME_AUTOMATON = ahocorasick.Automaton()
+    for _k, _v in _NAME_MAP.items():
+        _NAME_AUTOMATON.add_word(_k, (_k, _v))
+    _NAME_AUTOMATON.make_automaton()
+    del _k, _v
+
+
+def _splice_names(text: str, folded: str) -> str:
+    """Replace the readable names in *text* using the automaton alone.
+
+    *folded* is ``text.lower()`` and must have the same length.  A hit only
+    counts when no word character touches it on either side, the rule of
+    the regex's ``std`` arm; a name then spans a whole word, so hits never
+    overlap.  *text* must not contain assignments or comment-only lines.
+    """
+    parts: list[str] = []
+    pos = 0
+    last = len(folded) - 1
+    for end, (name, std) in _NAME_AUTOMATON.iter(folded):
+        start = end - len(name) + 1
+        if start:
+            c = folded[start - 1]
+            if c.isalnum() or c == "_":
+                continue
+        if end < last:
+            c = folded[end + 1]
+            if c.isalnum() or c == "_":
+                continue
+        parts.append(text[pos:start])
+        parts.append(std)
+        pos = end + 1
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+def _replace_mnemonic(m: re.Match) -> str:
+    """``sub`` callback for the re.IGNORECASE variant of the combined regex."""
+    kind = m.lastgroup
+    if kind == "std":
+        word = m.group(0)
+        return _NAME_MAP.get(word.lower(), word)
+    if kind == "asg":
+        return _assignment_from_match(m)
+    return m.group(0)           # comment-only line
+
+
+def _translate_text(text: str) -> str:
+    """Rewrite *text* (one or more "\n"-separated lines) in a single scan.
+
+    The combined regex runs on ``text.lower()`` without re.IGNORECASE and
+    the replacements are spliced into *text*, so the case of operands and
+    comments is kept.
+    """
+    if _NAME_MARKER and _NAME_MARKER not in text and "=" not in text:
+        return text
+
+    folded = text.lower()
+    if len(folded) != len(text):
+        # Lower-casing changed the length (e.g. 'İ'), so spans would not
+        # line up; match case-insensitively on the original instead.
+        return _MNEMONIC_RE_CI.sub(_replace_mnemonic, text)
+
+    get = _NAME_MAP.get
+    parts: list[str] = []
+    pos = 0
+    regex = _MNEMONIC_RE_ASCII if ascii_safe(folded) else _MNEMONIC_RE
+    for m in regex.finditer(folded):
+        kind = m.lastgroup
+        if kind == "std":
+            std = get(m.group(0))
+            if std is None:
+                continue        # a word that only looks like a name
+        elif kind == "asg":
+            std = _translate_assignment(text[m.start():m.end()])
+        else:
+            continue            # comment-only line, copied with the next slice
+        start, end = m.span()
+        parts.append(text[pos:start])
+        parts.append(std)
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+# Leading word of a line and the ':' that makes it a label, if any.  The
+# word ends at the first non-word character, so "name,x" and "name;c" are
+# found as well as "name x".
+_LEADING_WORD_RE = re.compile(r"[^\S\n]*(\w+)(:?)")
+
+
+@functools.lru_cache(maxsize=8192)
 def translate_line(line: str) -> str:
     """Translate one source line from readable assembly to standard PIC asm.
 
@@ -145,6 +298,8 @@ def translate_line(line: str) -> str:
     - Labels ending with ':' are preserved.
     - Comments after ';' are preserved.
     - Readable mnemonics are replaced with standard mnemonics.
+
+    Results are cached by line; listings repeat many lines verbatim.
     """
     # Preserve leading whitespace
     stripped = line.rstrip("\n\r")
@@ -153,242 +308,123 @@ def translate_line(line: str) -> str:
     if stripped.strip() == "" or stripped.lstrip().startswith(";"):
         return stripped
 
-    # ── Try assignment syntax first ──
-    result = _translate_assignment(stripped)
-    if result is not None:
-        return result
+    # ── Fast path: "[label:] name operands" where only the name can match ──
+    # Rewritten with a dict lookup on the leading token; anything else
+    # (assignments, further names, odd labels) goes through the regex.
+    if "=" not in stripped:
+        pos = 0
+        for _ in range(2):
+            m = _LEADING_WORD_RE.match(stripped, pos)
+            if m is None:
+                break
+            tok = m.group(1)
+            std = _NAME_MAP.get(tok.lower())
+            if std is not None:
+                start, end = m.span(1)
+                if _NAME_MARKER and _NAME_MARKER not in stripped[end:]:
+                    return stripped[:start] + std + stripped[end:]
+                break
+            if not m.group(2) or _NAME_MARKER in tok:
+                break
+            pos = m.end()
+
+        # Names only: with pyahocorasick the automaton hits are spliced in
+        # directly instead of compiling a regex for this line's names.
+        if _NAME_AUTOMATON is not None:
+            folded = stripped.lower()
+            if len(folded) == len(stripped):
+                return _splice_names(stripped, folded)
+
+    # ── Assignment syntax, or readable-mnemonic replacement ──
+    return _translate_text(stripped)
 
-    # ── Standard readable-mnemonic replacement ──
-    def _replace(m: re.Match) -> str:
-        return INSTRUCTION_MAP_ALL[m.group(1).lower()]
 
-    return _MNEMONIC_RE.sub(_replace, stripped)
+def translate(source: str) -> str:
+    """Translate a full readable-assembly source string to standard PIC assembly.
 
+    The whole source is rewritten in a single MULTILINE scan.
+    """
+    source = LINE_BREAK_RE.sub("\n", source)
+    if source.endswith("\n"):
+        source = source[:-1]
+    return _translate_text(source)
 
-def translate(source: str) -> str:
-    """Translate a full readable-assembly source string to standard PIC assembly."""
-    return "\n".join(translate_line(line) for line in source.splitlines())
+
+def translate_iter(lines: Iterable[str]) -> Iterator[str]:
+    """Lazily translate *lines* (e.g. an open file) one line at a time.
+
+    Trailing newlines are dropped from the results, so
+    ``"\n".join(translate_iter(source.splitlines()))`` equals
+    ``translate(source)``.  Only the current line is held in memory.
+    """
+    return map(translate_line, lines)
+
+
+def translate_stream(src_file: io.TextIOBase, dst_file: io.TextIOBase) -> None:
+    """Translate *src_file* to *dst_file* without holding the whole source.
+
+    Lines are read in chunks of about STREAM_BUFFER characters; each chunk
+    goes through translate.  The output matches
+    ``translate(src_file.read()) + "\n"``.
+    """
+    translate_chunks(src_file, dst_file, translate)
 
 
 def print_instruction_reference() -> None:
-    """Print a nicely formatted reference table of all readable names."""
-
-    # ── English categories ──────────────────────────────────────────────
-    categories_en = {
-        "Byte-oriented file register operations": [
-            "add_w_to_f", "add_w_to_f_with_carry", "and_w_with_f", "clear_f",
-            "complement_f", "compare_f_skip_if_equal", "compare_f_skip_if_greater",
-            "compare_f_skip_if_less", "decrement_f", "decrement_f_skip_if_zero",
-            "decrement_f_skip_if_not_zero", "increment_f",
-            "increment_f_skip_if_zero", "increment_f_skip_if_not_zero",
-            "or_w_with_f", "move_f", "move_f_to_f", "move_w_to_f",
-            "multiply_w_with_f", "negate_f", "rotate_left_f_through_carry",
-            "rotate_left_f_no_carry", "rotate_right_f_through_carry",
-            "rotate_right_f_no_carry", "set_f", "subtract_f_from_w_with_borrow",
-            "subtract_w_from_f", "subtract_w_from_f_with_borrow",
-            "swap_nibbles_f", "test_f_skip_if_zero", "xor_w_with_f",
-        ],
-        "Bit-oriented file register operations": [
-            "bit_clear_f", "bit_set_f", "bit_test_f_skip_if_clear",
-            "bit_test_f_skip_if_set", "bit_toggle_f",
-        ],
-        "Literal operations": [
-            "add_literal_to_w", "and_literal_with_w", "or_literal_with_w",
-            "move_literal_to_bsr", "move_literal_to_w", "multiply_literal_with_w",
-            "subtract_w_from_literal", "xor_literal_with_w",
-        ],
-        "Control / branch operations": [
-            "branch_if_carry", "branch_if_negative", "branch_if_not_carry",
-            "branch_if_not_negative", "branch_if_not_overflow",
-            "branch_if_not_zero", "branch_if_overflow", "branch_always",
-            "branch_if_zero", "call_subroutine", "clear_watchdog_timer",
-            "decimal_adjust_w", "goto_address", "no_operation",
-            "pop_return_stack", "push_return_stack", "relative_call",
-            "software_reset", "return_from_interrupt",
-            "return_with_literal_in_w", "return_from_subroutine",
-            "enter_sleep_mode",
-        ],
-        "Table read / write operations": [
-            "table_read", "table_read_post_increment",
-            "table_read_post_decrement", "table_read_pre_increment",
-            "table_write", "table_write_post_increment",
-            "table_write_post_decrement", "table_write_pre_increment",
-        ],
-        "Extended instruction set (XINST = 1)": [
-            "add_literal_to_fsr", "add_literal_to_fsr2_and_return",
-            "call_subroutine_using_w", "move_indexed_to_f",
-            "move_indexed_to_indexed", "push_literal",
-            "subtract_literal_from_fsr",
-            "subtract_literal_from_fsr2_and_return",
-        ],
-    }
-
-    # ── Slovenian categories ────────────────────────────────────────────
-    categories_si = {
-        "Bajtno usmerjene operacije z registrom": [
-            "pristej_w_k_f", "pristej_w_k_f_s_prenosom", "in_w_z_f", "pocisti_f",
-            "komplementiraj_f", "primerjaj_f_preskoci_ce_enako",
-            "primerjaj_f_preskoci_ce_vecje", "primerjaj_f_preskoci_ce_manjse",
-            "zmanjsaj_f", "zmanjsaj_f_preskoci_ce_nic",
-            "zmanjsaj_f_preskoci_ce_ni_nic", "povecaj_f",
-            "povecaj_f_preskoci_ce_nic", "povecaj_f_preskoci_ce_ni_nic",
-            "ali_w_z_f", "premakni_f", "premakni_f_v_f", "premakni_w_v_f",
-            "pomnozi_w_z_f", "negiraj_f", "zavrti_levo_f_skozi_prenos",
-            "zavrti_levo_f_brez_prenosa", "zavrti_desno_f_skozi_prenos",
-            "zavrti_desno_f_brez_prenosa", "nastavi_f",
-            "odstej_f_od_w_z_izposojo", "odstej_w_od_f",
-            "odstej_w_od_f_z_izposojo", "zamenjaj_polbajta_f",
-            "testiraj_f_preskoci_ce_nic", "xali_w_z_f",
-        ],
-        "Bitno usmerjene operacije z registrom": [
-            "bit_pocisti_f", "bit_nastavi_f",
-            "bit_testiraj_f_preskoci_ce_pociscen",
-            "bit_testiraj_f_preskoci_ce_nastavljen", "bit_preklopi_f",
-        ],
-        "Operacije s konstantami": [
-            "pristej_konstanto_k_w", "in_konstanto_z_w", "ali_konstanto_z_w",
-            "premakni_konstanto_v_bsr", "premakni_konstanto_v_w",
-            "pomnozi_konstanto_z_w", "odstej_w_od_konstante",
-            "xali_konstanto_z_w",
-        ],
-        "Krmilne / vejne operacije": [
-            "vejitev_ce_prenos", "vejitev_ce_negativno",
-            "vejitev_ce_ni_prenosa", "vejitev_ce_ni_negativno",
-            "vejitev_ce_ni_prekoracitve", "vejitev_ce_ni_nic",
-            "vejitev_ce_prekoracitev", "vejitev_vedno", "vejitev_ce_nic",
-            "klici_podprogram", "pocisti_casovnik_psa",
-            "decimalno_prilagodi_w", "pojdi_na_naslov", "brez_operacije",
-            "odvzemi_iz_sklada", "potisni_na_sklad", "relativni_klic",
-            "programska_ponastavitev", "vrni_se_iz_prekinitve",
-            "vrni_se_s_konstanto_v_w", "vrni_se_iz_podprograma",
-            "vstopi_v_spanje",
-        ],
-        "Operacije branja / pisanja tabele": [
-            "beri_tabelo", "beri_tabelo_povecaj_po",
-            "beri_tabelo_zmanjsaj_po", "beri_tabelo_povecaj_pred",
-            "pisi_tabelo", "pisi_tabelo_povecaj_po",
-            "pisi_tabelo_zmanjsaj_po", "pisi_tabelo_povecaj_pred",
-        ],
-        "Razsirjeni nabor ukazov (XINST = 1)": [
-            "pristej_konstanto_k_fsr", "pristej_konstanto_k_fsr2_in_vrni",
-            "klici_podprogram_z_w", "premakni_indeksirano_v_f",
-            "premakni_indeksirano_v_indeksirano", "potisni_konstanto",
-            "odstej_konstanto_od_fsr",
-            "odstej_konstanto_od_fsr2_in_vrni",
-        ],
-    }
-
-    # Use sys.stdout with UTF-8 to avoid cp1250 encoding issues on Windows
-    import io
-    out = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", errors="replace")
-
-    def _print_section(title: str, categories: dict, instr_map: dict) -> None:
-        out.write("=" * 72 + "\n")
-        out.write(f"  {title}\n")
-        out.write("=" * 72 + "\n")
-        for cat_name, keys in categories.items():
-            pad = max(55 - len(cat_name), 4)
-            out.write(f"\n-- {cat_name} {'-' * pad}\n")
-            out.write(f"  {'Readable Name':<48} {'PIC18 Mnemonic'}\n")
-            out.write(f"  {'-' * 48} {'-' * 14}\n")
-            for k in keys:
-                out.write(f"  {k:<48} {instr_map[k]}\n")
-        out.write("\n")
-        out.flush()
-
-    # ── PIC16 English categories ─────────────────────────────────────────
-    categories_pic16_en = {
-        "PIC16 base set (unique to PIC16)": [
-            "clear_w", "rotate_left_f", "rotate_right_f",
-            "option_load", "load_tris",
-        ],
-        "PIC16 enhanced mid-range (PIC16F1xxx)": [
-            "add_w_to_f_with_carry_16", "subtract_w_from_f_with_borrow_16",
-            "logical_shift_left_f", "logical_shift_right_f",
-            "arithmetic_shift_right_f", "branch_relative",
-            "branch_relative_with_w", "call_subroutine_with_w",
-            "add_literal_to_fsr_16", "move_indirect_from_fsr",
-            "move_w_indirect_to_fsr", "move_literal_to_bsr_16",
-            "move_literal_to_pclath", "software_reset_16",
-        ],
-    }
-
-    # ── PIC16 Slovenian categories ──────────────────────────────────────
-    categories_pic16_si = {
-        "PIC16 osnovna (samo PIC16)": [
-            "pocisti_w", "zavrti_levo_f", "zavrti_desno_f",
-            "nalozi_opcijo", "nalozi_tris",
-        ],
-        "PIC16 razsirjeni srednji razred (PIC16F1xxx)": [
-            "pristej_w_k_f_s_prenosom_16", "odstej_w_od_f_z_izposojo_16",
-            "logicni_pomik_levo_f", "logicni_pomik_desno_f",
-            "aritmeticni_pomik_desno_f", "vejitev_relativna",
-            "vejitev_relativna_z_w", "klici_podprogram_z_w_16",
-            "pristej_konstanto_k_fsr_16", "premakni_posredno_iz_fsr",
-            "premakni_w_posredno_v_fsr", "premakni_konstanto_v_bsr_16",
-            "premakni_konstanto_v_pclath", "programska_ponastavitev_16",
-        ],
-    }
-
-    _print_section(
-        "PIC18 READABLE ASSEMBLY — INSTRUCTION REFERENCE (ENGLISH)",
-        categories_en,
-        INSTRUCTION_MAP,
-    )
-    _print_section(
-        "PIC18 BERLJIV ZBIRNIK — SEZNAM UKAZOV (SLOVENŠČINA)",
-        categories_si,
-        INSTRUCTION_MAP_SI,
-    )
-    _print_section(
-        "PIC16 READABLE ASSEMBLY — INSTRUCTION REFERENCE (ENGLISH)",
-        categories_pic16_en,
-        INSTRUCTION_MAP_PIC16,
-    )
-    _print_section(
-        "PIC16 BERLJIV ZBIRNIK — SEZNAM UKAZOV (SLOVENŠČINA)",
-        categories_pic16_si,
-        INSTRUCTION_MAP_PIC16_SI,
-    )
+    """Print a nicely formatted reference table of all readable names.
+
+    The tables live in pic18_reference, which is only imported here.
+    """
+    from pic18_reference import print_reference
+    print_reference(INSTRUCTION_MAP, INSTRUCTION_MAP_SI,
+                    INSTRUCTION_MAP_PIC16, INSTRUCTION_MAP_PIC16_SI)
 
 
 # ── CLI ─────────────────────────────────────────────────────────────────
 def main() -> None:
-    parser = argparse.ArgumentParser(
-        description="Translate readable PIC16/PIC18 assembly (.rasm) to standard PIC assembly.",
-    )
-    parser.add_argument(
-        "input",
-        nargs="?",
-        help="Input file with readable assembly (.rasm).  Omit to print the instruction reference.",
-    )
-    parser.add_argument(
-        "-o", "--output",
-        help="Output file for the translated assembly.  Defaults to stdout.",
-    )
-    parser.add_argument(
-        "--ref",
-        action="store_true",
-        help="Print the full instruction reference table and exit.",
-    )
-    args = parser.parse_args()
+    # Plain "input [-o output]" calls (build scripts translating many files)
+    # skip building the ArgumentParser.
+    simple = simple_args(sys.argv[1:])
+    if simple is not None:
+        args = types.SimpleNamespace(input=simple[0], output=simple[1], ref=False)
+    else:
+        import argparse  # only needed here; keeps library imports light
+
+        parser = argparse.ArgumentParser(
+            description="Translate readable PIC16/PIC18 assembly (.rasm) to standard PIC assembly.",
+        )
+        parser.add_argument(
+            "input",
+            nargs="?",
+            help="Input file with readable assembly (.rasm).  Omit to print the instruction reference.",
+        )
+        parser.add_argument(
+            "-o", "--output",
+            help="Output file for the translated assembly.  Defaults to stdout.",
+        )
+        parser.add_argument(
+            "--ref",
+            action="store_true",
+            help="Print the full instruction reference table and exit.",
+        )
+        args = parser.parse_args()
+
+    # UTF-8 stdout avoids cp1250 encoding issues on Windows
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
 
     if args.ref or args.input is None:
         print_instruction_reference()
         if args.input is None:
             return
 
-    with open(args.input, "r", encoding="utf-8") as f:
-        source = f.read()
-
-    result = translate(source)
-
-    if args.output:
-        with open(args.output, "w", encoding="utf-8") as f:
-            f.write(result + "\n")
-        print(f"Translated assembly written to: {args.output}")
-    else:
-        print(result)
+    with open(args.input, "r", encoding="utf-8", buffering=STREAM_BUFFER) as src:
+        if args.output:
+            with open(args.output, "w", encoding="utf-8", buffering=STREAM_BUFFER) as dst:
+                translate_stream(src, dst)
+            print(f"Translated assembly written to: {args.output}")
+        else:
+            translate_stream(src, sys.stdout)
 
 
 if __name__ == "__main__":